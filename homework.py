@@ -1,42 +1,112 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Type
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def _compiled(formula):
+    """Скомпилировать формулу через numba для пакетной обработки.
+
+    numba импортируется только при первом вызове, а без неё формула
+    остаётся обычной функцией Python. Скомпилированные формулы отпускают
+    GIL и могут считаться параллельно из нескольких потоков.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return formula
+    return njit(cache=True, nogil=True)(formula)
+
+
+def _running_calories(mean_speed, weight, duration,
+                      coeff_1, coeff_2, m_in_km, min_in_h):
+    """Формула калорий для бега."""
+    return ((coeff_1 * mean_speed + coeff_2)
+            * weight / m_in_km
+            * (duration * min_in_h))
+
+
+def _sports_walking_calories(speed_ms, inv_height_m, weight, time_in_min,
+                             coeff_3, coeff_4):
+    """Формула калорий для спортивной ходьбы."""
+    return ((coeff_3 * weight + (speed_ms * speed_ms * inv_height_m)
+            * coeff_4 * weight) * time_in_min)
+
+
+def _swimming_calories(mean_speed, weight, duration, coeff_5, coeff_6):
+    """Формула калорий для плавания."""
+    return (mean_speed + coeff_5) * coeff_6 * weight * duration
+
+
+def _format_message(training_type: str,
+                    duration: float,
+                    distance: float,
+                    speed: float,
+                    calories: float) -> str:
+    """Собрать текст сообщения о тренировке."""
+    return (f'Тип тренировки: {training_type}; '
+            f'Длительность: {duration:.3f} ч.; '
+            f'Дистанция: {distance:.3f} км; '
+            f'Ср. скорость: {speed:.3f} км/ч; '
+            f'Потрачено ккал: {calories:.3f}.')
+
+
+@dataclass(slots=True)
 class InfoMessage:
     """Информационное сообщение о тренировке."""
+    MESSAGE: ClassVar[str] = ('Тип тренировки: {training_type}; '
+                              'Длительность: {duration:.3f} ч.; '
+                              'Дистанция: {distance:.3f} км; '
+                              'Ср. скорость: {speed:.3f} км/ч; '
+                              'Потрачено ккал: {calories:.3f}.')
+
     training_type: str
     duration: float
     distance: float
     speed: float
     calories: float
-    message: str = ('Тип тренировки: {training_type}; '
-                    'Длительность: {duration:.3f} ч.; '
-                    'Дистанция: {distance:.3f} км; '
-                    'Ср. скорость: {speed:.3f} км/ч; '
-                    'Потрачено ккал: {calories:.3f}.')
+    message: str = MESSAGE
 
     def get_message(self) -> str:
         """Выводим информацию о тренировке."""
-        return self.message.format(**asdict(self))
+        # Стандартный шаблон выводится через f-строку в _format_message.
+        if self.message == self.MESSAGE:
+            return _format_message(self.training_type,
+                                   self.duration,
+                                   self.distance,
+                                   self.speed,
+                                   self.calories)
+        return self.message.format(training_type=self.training_type,
+                                   duration=self.duration,
+                                   distance=self.distance,
+                                   speed=self.speed,
+                                   calories=self.calories)
 
 
+@dataclass(eq=False)
 class Training:
     """Базовый класс тренировки."""
-    LEN_STEP: float = 0.65  # Путь за 1 шаг (метр).
-    M_IN_KM: int = 1000  # Метров в 1 км.
-    MIN_IN_H = 60        # Минут в 1 часе.
+    TRAINING_NAME: ClassVar[str] = 'Training'
+    LEN_STEP: ClassVar[float] = 0.65  # Путь за 1 шаг (метр).
+    M_IN_KM: ClassVar[float] = 1000.0  # Метров в 1 км.
+    MIN_IN_H: ClassVar[float] = 60.0  # Минут в 1 часе.
 
-    def __init__(self,
-                 action: int,
-                 duration: float,
-                 weight: float,
-                 ) -> None:
-        self.action = action
-        self.duration = duration
-        self.weight_kg = weight
+    action: int
+    duration: float
+    weight: float
+
+    @property
+    def weight_kg(self) -> float:
+        """Вес спортсмена в кг (прежнее имя поля weight)."""
+        return self.weight
 
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
@@ -55,67 +125,64 @@ class Training:
 
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        return (InfoMessage(self.__class__.__name__,
+        return (InfoMessage(self.TRAINING_NAME,
                 self.duration,
                 self.get_distance(),
                 self.get_mean_speed(),
                 self.get_spent_calories()))
 
 
+@dataclass(eq=False)
 class Running(Training):
     """Тренировка: бег."""
-    COEFF_1 = 18  # Константа калорий - 18.
+    TRAINING_NAME: ClassVar[str] = 'Running'
+    COEFF_1 = 18.0  # Константа калорий - 18.
     COEFF_2 = 1.79  # Константа калорий - 1.79.
 
     def get_spent_calories(self) -> float:
         """Количество калорий во время бега."""
-        return ((self.COEFF_1 * self.get_mean_speed() + self.COEFF_2)
-                * self.weight_kg / self.M_IN_KM
-                * (self.duration * self.MIN_IN_H))
+        mean_speed = self.action * self.LEN_STEP / self.M_IN_KM / self.duration
+        return _running_calories(mean_speed, self.weight, self.duration,
+                                 self.COEFF_1, self.COEFF_2,
+                                 self.M_IN_KM, self.MIN_IN_H)
 
 
+@dataclass(eq=False)
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
+    TRAINING_NAME: ClassVar[str] = 'SportsWalking'
     COEFF_3 = 0.035  # Константа калорий - 0.035.
     COEFF_4 = 0.029  # Константа калорий - 0.029.
     M_IN_SEC = 0.278  # Перевод км/ч в м/с.
-    H_MET = 100       # Перевод из м. в см.
+    H_MET = 100.0     # Перевод из м. в см.
 
-    def __init__(self,
-                 action: int,
-                 duration: float,
-                 weight: float,
-                 height: int
-                 ) -> None:
-        super().__init__(action, duration, weight)
-        self.height_cm = height
+    height: int
+
+    @property
+    def height_cm(self) -> int:
+        """Рост спортсмена в см (прежнее имя поля height)."""
+        return self.height
 
     def get_spent_calories(self) -> float:
         """Количество калорий во время ходьбы."""
-        self.speed_ms = self.get_mean_speed() * self.M_IN_SEC
-        self.height_cm = self.height_cm / self.H_MET
-        self.time_in_min = self.duration * self.MIN_IN_H
-        return ((self.COEFF_3 * self.weight_kg + (self.speed_ms ** 2
-                / self.height_cm) * self.COEFF_4 * self.weight_kg)
-                * self.time_in_min)
+        # Обратный рост считается при каждом вызове: поля тренировки
+        # изменяемы, и сохранённое значение могло бы устареть.
+        return _sports_walking_calories(
+            self.get_mean_speed() * self.M_IN_SEC, self.H_MET / self.height,
+            self.weight, self.duration * self.MIN_IN_H,
+            self.COEFF_3, self.COEFF_4)
 
 
+@dataclass(eq=False)
 class Swimming(Training):
     """Тренировка: плавание."""
-    LEN_STEP: float = 1.38  # Путь за 1 гребок (метр).
+    TRAINING_NAME: ClassVar[str] = 'Swimming'
+    LEN_STEP: ClassVar[float] = 1.38  # Путь за 1 гребок (метр).
     COEFF_5 = 1.1  # Константа калорий - 1.1.
-    COEFF_6 = 2  # Константа калорий - 2.
+    COEFF_6 = 2.0  # Константа калорий - 2.
 
-    def __init__(self,
-                 action: int,
-                 duration: float,
-                 weight: float,
-                 length_pool: int,
-                 count_pool: int
-                 ) -> None:
-        super().__init__(action, duration, weight)
-        self.length_pool = length_pool
-        self.count_pool = count_pool
+    length_pool: int
+    count_pool: int
 
     def get_mean_speed(self) -> float:
         """Средняя скорость во время плавания."""
@@ -124,36 +191,237 @@ class Swimming(Training):
 
     def get_spent_calories(self) -> float:
         """Количество калорий во время плавания."""
-        return ((self.get_mean_speed() + self.COEFF_5) * self.COEFF_6
-                * self.weight_kg * self.duration)
+        mean_speed = (self.length_pool * self.count_pool
+                      / self.M_IN_KM / self.duration)
+        return _swimming_calories(mean_speed, self.weight, self.duration,
+                                  self.COEFF_5, self.COEFF_6)
+
+
+class WorkoutCode:
+    """Коды тренировок в пакетах датчиков."""
+    SWIMMING = 'SWM'  # Плавание.
+    RUNNING = 'RUN'   # Бег.
+    WALKING = 'WLK'   # Спортивная ходьба.
 
 
 def read_package(workout_type: str, data: list) -> Training:
     """Прочитать данные полученные от датчиков."""
-    training_data: dict[str, Type[Training]] = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking
+    match workout_type:
+        case WorkoutCode.SWIMMING:
+            return Swimming(*data)
+        case WorkoutCode.RUNNING:
+            return Running(*data)
+        case WorkoutCode.WALKING:
+            return SportsWalking(*data)
+    raise ValueError('Введён неверный идентификатор тренировки.')
+
+
+def _as_array(values) -> np.ndarray:
+    """Привести последовательность значений к массиву NumPy."""
+    if np is None:
+        raise ImportError('Для пакетной обработки установите numpy.')
+    return np.asarray(values, dtype=float)
+
+
+def running_calories_np(action, duration, weight) -> np.ndarray:
+    """Количество калорий для массива пробежек."""
+    action, duration, weight = map(_as_array, (action, duration, weight))
+    mean_speed = action * Running.LEN_STEP / Running.M_IN_KM / duration
+    return _compiled(_running_calories)(mean_speed, weight, duration,
+                                        Running.COEFF_1, Running.COEFF_2,
+                                        Running.M_IN_KM, Running.MIN_IN_H)
+
+
+def sports_walking_calories_np(action, duration, weight,
+                               height) -> np.ndarray:
+    """Количество калорий для массива тренировок спортивной ходьбой."""
+    action, duration, weight, height = map(
+        _as_array, (action, duration, weight, height))
+    mean_speed = (action * SportsWalking.LEN_STEP
+                  / SportsWalking.M_IN_KM / duration)
+    return _compiled(_sports_walking_calories)(
+        mean_speed * SportsWalking.M_IN_SEC,
+        SportsWalking.H_MET / height,
+        weight,
+        duration * SportsWalking.MIN_IN_H,
+        SportsWalking.COEFF_3,
+        SportsWalking.COEFF_4)
+
+
+def swimming_calories_np(action, duration, weight, length_pool,
+                         count_pool) -> np.ndarray:
+    """Количество калорий для массива заплывов.
+
+    Число гребков action на калории не влияет и принимается, чтобы
+    порядок аргументов совпадал с конструктором Swimming.
+    """
+    duration, weight, length_pool, count_pool = map(
+        _as_array, (duration, weight, length_pool, count_pool))
+    mean_speed = length_pool * count_pool / Swimming.M_IN_KM / duration
+    return _compiled(_swimming_calories)(mean_speed, weight, duration,
+                                         Swimming.COEFF_5, Swimming.COEFF_6)
+
+
+class TrainingBatch:
+    """Набор тренировок, хранящийся по столбцам в массивах NumPy."""
+    SWIMMING: ClassVar[int] = 0
+    RUNNING: ClassVar[int] = 1
+    WALKING: ClassVar[int] = 2
+    KINDS: ClassVar[dict[str, int]] = {
+        WorkoutCode.SWIMMING: SWIMMING,
+        WorkoutCode.RUNNING: RUNNING,
+        WorkoutCode.WALKING: WALKING,
+    }
+    PACKAGE_COLUMNS: ClassVar[dict[str, tuple[str, ...]]] = {
+        WorkoutCode.SWIMMING: (
+            'action', 'duration', 'weight', 'length_pool', 'count_pool'),
+        WorkoutCode.RUNNING: ('action', 'duration', 'weight'),
+        WorkoutCode.WALKING: ('action', 'duration', 'weight', 'height'),
+    }
+    REQUIRED_COLUMNS: ClassVar[dict[int, tuple[str, ...]]] = {
+        SWIMMING: ('lengths_pool', 'counts_pool'),
+        WALKING: ('heights',),
     }
 
-    if workout_type not in training_data:
-        raise ValueError('Введён неверный идентификатор тренировки.')
-    return training_data[workout_type](*data)
+    def __init__(self,
+                 kinds,
+                 actions,
+                 durations,
+                 weights,
+                 heights=None,
+                 lengths_pool=None,
+                 counts_pool=None
+                 ) -> None:
+        if np is None:
+            raise ImportError('Для пакетной обработки установите numpy.')
+        self.kinds = np.asarray(kinds, dtype=np.int8)
+        if self.kinds.ndim != 1:
+            raise ValueError('Виды тренировок должны быть списком.')
+        if not np.isin(self.kinds, tuple(self.KINDS.values())).all():
+            raise ValueError('Введён неверный вид тренировки.')
+        optional = {
+            'heights': heights,
+            'lengths_pool': lengths_pool,
+            'counts_pool': counts_pool,
+        }
+        for kind, names in self.REQUIRED_COLUMNS.items():
+            missing = [name for name in names if optional[name] is None]
+            if missing and (self.kinds == kind).any():
+                raise ValueError(
+                    f'Для тренировок вида {kind} нет столбцов: '
+                    f'{", ".join(missing)}.')
+        size = len(self.kinds)
+        self.actions = _as_array(actions)
+        self.durations = _as_array(durations)
+        self.weights = _as_array(weights)
+        self.heights = self._optional_column(heights, size)
+        self.lengths_pool = self._optional_column(lengths_pool, size)
+        self.counts_pool = self._optional_column(counts_pool, size)
+        for name in ('actions', 'durations', 'weights',
+                     'heights', 'lengths_pool', 'counts_pool'):
+            if getattr(self, name).shape != self.kinds.shape:
+                raise ValueError(
+                    f'Столбец {name} должен содержать {size} значений.')
+
+    @staticmethod
+    def _optional_column(values, size: int) -> np.ndarray:
+        """Столбец, который нужен не всем видам тренировок."""
+        if values is None:
+            return np.full(size, np.nan)
+        return _as_array(values)
+
+    @classmethod
+    def from_table(cls, table) -> TrainingBatch:
+        """Собрать набор из таблицы, например pandas.DataFrame.
+
+        Ожидаются столбцы workout_type, action, duration, weight, а для
+        ходьбы и плавания ещё height либо length_pool и count_pool.
+        """
+        if np is None:
+            raise ImportError('Для пакетной обработки установите numpy.')
+        workout_type = np.asarray(table['workout_type'])
+        kinds = np.full(len(workout_type), -1, dtype=np.int8)
+        for code, kind in cls.KINDS.items():
+            kinds[workout_type == code] = kind
+        if (kinds < 0).any():
+            raise ValueError('Введён неверный идентификатор тренировки.')
+        return cls(kinds,
+                   table['action'],
+                   table['duration'],
+                   table['weight'],
+                   table['height'] if 'height' in table else None,
+                   table['length_pool'] if 'length_pool' in table else None,
+                   table['count_pool'] if 'count_pool' in table else None)
+
+    @classmethod
+    def from_packages(cls, packages) -> TrainingBatch:
+        """Собрать набор из пакетов вида (workout_type, data)."""
+        table: dict[str, list] = {
+            'workout_type': [],
+            'action': [],
+            'duration': [],
+            'weight': [],
+            'height': [],
+            'length_pool': [],
+            'count_pool': [],
+        }
+        for workout_type, data in packages:
+            columns = cls.PACKAGE_COLUMNS.get(workout_type)
+            if columns is None:
+                raise ValueError('Введён неверный идентификатор тренировки.')
+            if len(data) != len(columns):
+                raise ValueError(
+                    f'Пакет {workout_type} должен содержать '
+                    f'{len(columns)} значений.')
+            table['workout_type'].append(workout_type)
+            values = dict(zip(columns, data))
+            for column in tuple(table)[1:]:
+                table[column].append(values.get(column, float('nan')))
+        return cls.from_table(table)
+
+    def compute_calories(self) -> np.ndarray:
+        """Посчитать калории для всех тренировок набора."""
+        calories = np.empty(len(self.kinds))
+        swimming = self.kinds == self.SWIMMING
+        calories[swimming] = swimming_calories_np(
+            self.actions[swimming], self.durations[swimming],
+            self.weights[swimming], self.lengths_pool[swimming],
+            self.counts_pool[swimming])
+        running = self.kinds == self.RUNNING
+        calories[running] = running_calories_np(
+            self.actions[running], self.durations[running],
+            self.weights[running])
+        walking = self.kinds == self.WALKING
+        calories[walking] = sports_walking_calories_np(
+            self.actions[walking], self.durations[walking],
+            self.weights[walking], self.heights[walking])
+        return calories
+
+
+def read_packages_batch(packages) -> np.ndarray:
+    """Посчитать калории для таблицы пакетов, например pandas.DataFrame."""
+    return TrainingBatch.from_table(packages).compute_calories()
+
+
+def get_training_message(training: Training) -> str:
+    """Получить текст сообщения о тренировке."""
+    info: InfoMessage = training.show_training_info()
+    return info.get_message()
 
 
 def main(training: Training) -> None:
     """Главная функция."""
-    info: InfoMessage = training.show_training_info()
-    print(info.get_message())
+    print(get_training_message(training))
 
 
 if __name__ == '__main__':
     packages: list[tuple[str, list[int]]] = [
-        ('SWM', [720, 1, 80, 25, 40]),
-        ('RUN', [15000, 1, 75]),
-        ('WLK', [9000, 1, 75, 180]),
+        (WorkoutCode.SWIMMING, [720, 1, 80, 25, 40]),
+        (WorkoutCode.RUNNING, [15000, 1, 75]),
+        (WorkoutCode.WALKING, [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    # Все сообщения выводятся одной записью вместо print() на каждый пакет.
+    sys.stdout.write(''.join(
+        get_training_message(read_package(workout_type, data)) + '\n'
+        for workout_type, data in packages))
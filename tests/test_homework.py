@@ -106,6 +106,15 @@ def test_InfoMessage_get_message(input_data, expected):
     )
 
 
+def test_InfoMessage_custom_message():
+    info_message = homework.InfoMessage(
+        'Running', 1, 2, 3, 4, '{training_type}: {calories:.1f} ккал')
+    assert info_message.get_message() == 'Running: 4.0 ккал', (
+        'Метод `get_message` класса `InfoMessage` должен использовать '
+        'переданный шаблон сообщения.'
+    )
+
+
 def test_Training():
     assert inspect.isclass(homework.Training), (
         '`Training` должен быть классом.'
@@ -224,6 +233,22 @@ def test_Training_show_training_info(monkeypatch):
     )
 
 
+def test_Training_recalculates_after_change():
+    running = homework.Running(15000, 1, 75)
+    assert running.get_mean_speed() == 9.75
+    running.duration = 2
+    assert running.get_mean_speed() == 4.875, (
+        'После изменения длительности тренировки средняя скорость '
+        'должна быть пересчитана.'
+    )
+    assert running.get_spent_calories() == (
+        homework.Running(15000, 2, 75).get_spent_calories()
+    ), (
+        'После изменения длительности тренировки калории '
+        'должны быть пересчитаны.'
+    )
+
+
 def test_Swimming():
     assert hasattr(homework, 'Swimming'), 'Создайте класс `Swimming`'
     assert inspect.isclass(homework.Swimming), (
@@ -355,6 +380,19 @@ def test_SportsWalking_get_spent_calories(input_data, expected):
     )
 
 
+def test_SportsWalking_get_spent_calories_repeatable():
+    sports_walking = homework.SportsWalking(9000, 1, 75, 180)
+    first = sports_walking.get_spent_calories()
+    assert sports_walking.get_spent_calories() == first, (
+        'Метод `get_spent_calories` в классе `SportsWalking` не должен '
+        'изменять атрибуты объекта.'
+    )
+    assert sports_walking.height_cm == 180, (
+        'Метод `get_spent_calories` в классе `SportsWalking` не должен '
+        'изменять рост спортсмена.'
+    )
+
+
 def test_Running():
     assert hasattr(homework, 'Running'), 'Создайте класс `Running`'
     assert inspect.isclass(homework.Running), '`Running` должен быть классом.'
@@ -451,3 +489,92 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('formula, training_class, input_data', [
+    ('running_calories_np', 'Running',
+        ([9000, 1, 75], [420, 4, 20], [1206, 12, 6])),
+    ('sports_walking_calories_np', 'SportsWalking',
+        ([9000, 1, 75, 180], [420, 4, 20, 42], [1206, 12, 6, 12])),
+    ('swimming_calories_np', 'Swimming',
+        ([720, 1, 80, 25, 40], [420, 4, 20, 42, 4], [1206, 12, 6, 12, 6])),
+])
+def test_calories_np(formula, training_class, input_data):
+    pytest.importorskip('numpy')
+    columns = list(zip(*input_data))
+    result = getattr(homework, formula)(*columns)
+    expected = [
+        getattr(homework, training_class)(*data).get_spent_calories()
+        for data in input_data
+    ]
+    assert list(result.round(3)) == [round(value, 3) for value in expected], (
+        f'Функция `{formula}` должна считать калории так же, '
+        f'как класс `{training_class}`.'
+    )
+
+
+def test_read_packages_batch():
+    pytest.importorskip('numpy')
+    packages = {
+        'workout_type': ['SWM', 'RUN', 'WLK'],
+        'action': [720, 15000, 9000],
+        'duration': [1, 1, 1],
+        'weight': [80, 75, 75],
+        'height': [0, 0, 180],
+        'length_pool': [25, 0, 0],
+        'count_pool': [40, 0, 0],
+    }
+    result = homework.read_packages_batch(packages)
+    assert list(result.round(3)) == [336.0, 797.805, 349.252], (
+        'Функция `read_packages_batch` должна считать калории '
+        'для каждого пакета.'
+    )
+    packages['workout_type'][0] = 'XXX'
+    with pytest.raises(ValueError):
+        homework.read_packages_batch(packages)
+
+
+def test_TrainingBatch_compute_calories():
+    pytest.importorskip('numpy')
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [1206, 12, 6]),
+        ('WLK', [9000, 1.5, 75, 180]),
+        ('WLK', [3000.33, 2.512, 75.8, 180.1]),
+    ]
+    batch = homework.TrainingBatch.from_packages(packages)
+    expected = [
+        round(homework.read_package(*package).get_spent_calories(), 3)
+        for package in packages
+    ]
+    assert list(batch.compute_calories().round(3)) == expected, (
+        'Метод `compute_calories` класса `TrainingBatch` должен считать '
+        'калории так же, как классы тренировок.'
+    )
+
+
+def test_TrainingBatch_invalid_data():
+    pytest.importorskip('numpy')
+    with pytest.raises(ValueError):
+        homework.TrainingBatch([0, 1, 5], [1, 1, 1], [1, 1, 1], [1, 1, 1])
+    with pytest.raises(ValueError):
+        homework.read_packages_batch({
+            'workout_type': ['WLK'],
+            'action': [9000],
+            'duration': [1],
+            'weight': [75],
+        })
+    with pytest.raises(ValueError):
+        homework.TrainingBatch.from_packages([('WLK', [9000, 1, 75])])
+
+
+@pytest.mark.parametrize('input_data', [
+    ([2, 1], [9000, 100], [1, 1], [75, 70]),
+    ([0], [720], [1], [80], None, [25], None),
+    ([1, 1], [9000], [1, 1], [75, 70]),
+    ([1, 2], [9000, 100], [1, 1], [75, 70], [180]),
+])
+def test_TrainingBatch_invalid_columns(input_data):
+    pytest.importorskip('numpy')
+    with pytest.raises(ValueError):
+        homework.TrainingBatch(*input_data)